@@ -29,12 +29,22 @@ All unknown options after the recognised ones are forwarded verbatim to
 from __future__ import annotations
 
 import argparse
+import hashlib
+import importlib.util
 import os
+import pickle
+import runpy
+import shutil
+import stat
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Set, Tuple
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "mutatex"
 
 
 def _parse_args() -> Tuple[argparse.Namespace, List[str]]:
@@ -48,25 +58,138 @@ def _parse_args() -> Tuple[argparse.Namespace, List[str]]:
 
     optional = p.add_argument_group("optional arguments")
     optional.add_argument("-o", "--output", default="heatmap.pdf", help="Output filename passed to ddg2heatmap (-o)")
-    optional.add_argument("--keep-temp", action="store_true", help="Keep the filtered position list file instead of deleting it")
+    optional.add_argument(
+        "--keep-temp",
+        action="store_true",
+        help="Write the filtered position list to a file and keep it (by default it is passed through a temporary FIFO)",
+    )
+    optional.add_argument(
+        "--cache-listing",
+        action="store_true",
+        help=f"Cache the data directory listing in {CACHE_DIR} and reuse it while the directory is unchanged",
+    )
+    optional.add_argument(
+        "--parallel-stat",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Check energy files with N concurrent stat() calls instead of listing the data directory "
+        "(useful on network filesystems with large directories)",
+    )
     optional.add_argument("-h", "--help", action="help", help="Show this help and exit")
 
     # allow every other arg; they will be forwarded to ddg2heatmap
     return p.parse_known_args()
 
 
-def _filter_positions(position_file: Path, data_dir: Path) -> Tuple[Path, int]:
-    """Return path to filtered position list (tmp file) and number of removed entries."""
-    positions: List[str] = [line.strip() for line in position_file.read_text().splitlines() if line.strip()]
+def _listing_cache(data_dir: Path) -> Set[str]:
+    """Return the names of all files in *data_dir*, reusing an on-disk cache.
+
+    The cache is keyed by the directory path and invalidated whenever the
+    directory mtime changes (i.e. an entry was added, removed or renamed), so
+    an unchanged directory costs a single stat() plus a pickle load.
+    """
+    mtime_ns = data_dir.stat().st_mtime_ns
+    # abspath() only joins with the cwd, so relative paths get a stable key
+    # without the syscalls of resolve()
+    cache_key = hashlib.blake2b(os.path.abspath(data_dir).encode()).hexdigest()
+    cache_file = CACHE_DIR / (cache_key + ".pkl")
+
+    try:
+        with cache_file.open("rb") as fh:
+            cached_mtime_ns, names = pickle.load(fh)
+        if cached_mtime_ns == mtime_ns:
+            return names
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass  # missing or unreadable cache – rebuild it
+
+    with os.scandir(data_dir) as it:
+        names = {entry.name for entry in it if entry.is_file()}
+
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # write to a temp file and rename it into place, so concurrent runs
+        # never read or clobber a half-written cache
+        with tempfile.NamedTemporaryFile("wb", dir=CACHE_DIR, suffix=".tmp", delete=False) as fh:
+            tmp_name = fh.name
+            pickle.dump((mtime_ns, names), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except OSError as exc:
+        sys.stderr.write(f"[WARN] Could not write listing cache {cache_file}: {exc}\n")
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+    return names
+
+
+def _stat_positions(positions: Set[str], data_dir: Path, workers: int = 0) -> Set[str]:
+    """Return the subset of *positions* that are files in *data_dir*, stat'ing each one.
+
+    Paths are built on plain strings to avoid a Path object per lookup. With
+    *workers* > 0 the stat() calls are spread over a thread pool, which hides
+    per-call latency on network filesystems (stat releases the GIL).
+    """
+    prefix = os.fspath(data_dir) + os.sep
+    if workers <= 0:
+        return {pos for pos in positions if os.path.isfile(prefix + pos)}
+
+    ordered = list(positions)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        found = ex.map(os.path.isfile, [prefix + pos for pos in ordered])
+        return {pos for pos, is_file in zip(ordered, found) if is_file}
+
+
+def _feed_fifo(fifo_path: Path, data: str) -> None:
+    """Write *data* to *fifo_path*; blocks until the reader opens the FIFO."""
+    try:
+        with fifo_path.open("w") as fh:
+            fh.write(data)
+    except OSError:
+        pass  # reader went away (BrokenPipeError) – ddg2heatmap reports its own errors
+
+
+def _filter_positions(
+    position_file: Path, data_dir: Path, use_cache: bool = False, stat_workers: int = 0, use_fifo: bool = False
+) -> Tuple[Path, int]:
+    """Return path to filtered position list (tmp file or FIFO) and number of removed entries.
+
+    With *use_fifo* the list is streamed to the reader through a named pipe fed
+    by a background thread, so nothing is written to disk. If nothing needs
+    filtering, *position_file* itself is returned.
+    """
+    positions: List[str] = []
+    verbatim = True  # no blank lines or stray whitespace that ddg2heatmap would reject
+    with position_file.open() as fh:
+        for line in fh:
+            pos = line.strip()
+            if pos:
+                positions.append(pos)
+            if not pos or pos != line.rstrip("\n"):
+                verbatim = False
+
+    wanted = set(positions)
+    try:
+        if use_cache:
+            existing = _listing_cache(data_dir)
+        elif stat_workers > 0:
+            existing = _stat_positions(wanted, data_dir, stat_workers)
+        else:
+            # one directory scan instead of one stat() per position; only entries we
+            # actually look for are kept, so huge data directories don't bloat the set
+            with os.scandir(data_dir) as it:
+                existing = {entry.name for entry in it if entry.name in wanted and entry.is_file()}
+    except PermissionError:
+        # directory can be searched but not listed (e.g. mode 711)
+        existing = _stat_positions(wanted, data_dir, stat_workers)
+
     available: List[str] = []
     missing: List[str] = []
-
     for pos in positions:
-        energy_file = data_dir / pos
-        if energy_file.is_file():
-            available.append(pos)
-        else:
-            missing.append(pos)
+        (available if pos in existing else missing).append(pos)
 
     if missing:
         sys.stderr.write(f"[INFO] Excluding {len(missing)} residue(s) with missing energy files:\n")
@@ -74,23 +197,101 @@ def _filter_positions(position_file: Path, data_dir: Path) -> Tuple[Path, int]:
             sys.stderr.write(f"  • {m}\n")
     else:
         sys.stderr.write("[INFO] All positions have energy files – no filtering needed.\n")
+        if verbatim:
+            return position_file, 0
+
+    if use_fifo:
+        fifo_path = Path(tempfile.mkdtemp(prefix="filtered_pos_")) / "positions.txt"
+        try:
+            os.mkfifo(fifo_path, 0o600)
+        except OSError:
+            # filesystem without FIFO support (e.g. vfat, some FUSE mounts) – use a tmp file
+            os.rmdir(fifo_path.parent)
+        else:
+            data = "".join(pos + "\n" for pos in available)
+            threading.Thread(target=_feed_fifo, args=(fifo_path, data), daemon=True).start()
+            return fifo_path, len(missing)
 
     # write available positions to tmp file
     tmp_handle = tempfile.NamedTemporaryFile("w", prefix="filtered_pos_", suffix=".txt", delete=False)
-    for pos in available:
-        tmp_handle.write(pos + "\n")
+    tmp_handle.writelines(pos + "\n" for pos in available)
     tmp_handle.flush()
     tmp_handle.close()
     return Path(tmp_handle.name), len(missing)
 
 
+def _remove_positions_file(path: Path) -> None:
+    """Delete the filtered position list created by `_filter_positions`."""
+    try:
+        if stat.S_ISFIFO(os.stat(path).st_mode):
+            # release a writer still waiting for a reader (e.g. ddg2heatmap failed
+            # before reading the list); its write then fails and the thread ends
+            os.close(os.open(path, os.O_RDONLY | os.O_NONBLOCK))
+            os.unlink(path)
+            os.rmdir(path.parent)
+        else:
+            os.unlink(path)
+    except OSError:
+        pass
+
+
+def _is_own_python_script(script: str) -> bool:
+    """Return True if *script* is a Python script installed for this interpreter.
+
+    That is the case when its shebang names sys.executable, directly or
+    through `env`. Installed scripts get such a shebang; shell or binary
+    executables (even in this environment's bin directory) do not.
+    """
+    try:
+        with open(script, "rb") as fh:
+            first_line = fh.readline()
+    except OSError:
+        return False
+    if not first_line.startswith(b"#!"):
+        return False
+
+    shebang = first_line[2:].decode(errors="replace").split()
+    if not shebang:
+        return False
+    interpreter = shebang[0]
+    if os.path.basename(interpreter) == "env":
+        names = [arg for arg in shebang[1:] if not arg.startswith("-")]
+        interpreter = shutil.which(names[0]) if names else None
+    # no realpath(): interpreters of different venvs resolve to the same binary
+    return interpreter is not None and os.path.abspath(interpreter) == os.path.abspath(sys.executable)
+
+
+def _run_ddg2heatmap(ddg_cmd: List[str]) -> None:
+    """Run `ddg2heatmap` with the given command line.
+
+    When the `ddg2heatmap` found on PATH is this environment's Python script
+    and the `mutatex` package is importable, it is executed in-process, saving
+    the interpreter start-up and numpy/matplotlib imports of a child process.
+    Otherwise (shell shims, scripts of other environments, ...) it is run as a
+    subprocess.
+    """
+    script = shutil.which(ddg_cmd[0])
+    if script is None or not _is_own_python_script(script) or importlib.util.find_spec("mutatex") is None:
+        subprocess.run(ddg_cmd, check=True)
+        return
+
+    saved_argv = sys.argv
+    sys.argv = [script] + ddg_cmd[1:]
+    try:
+        runpy.run_path(script, run_name="__main__")
+    finally:
+        sys.argv = saved_argv
+
+
 def main() -> None:  # noqa: D401
     args, extra = _parse_args()
 
-    pdb_path = Path(args.pdb).expanduser().resolve()
-    data_dir = Path(args.data_directory).expanduser().resolve()
-    mutlist_path = Path(args.mutation_list).expanduser().resolve()
-    poslist_path = Path(args.position_list).expanduser().resolve()
+    # no resolve(): ddg2heatmap accepts relative paths, and realpath() walks
+    # every component of each path, which is slow on deep network mounts
+    pdb_path = Path(args.pdb).expanduser()
+    data_dir = Path(args.data_directory).expanduser()
+    mutlist_path = Path(args.mutation_list).expanduser()
+    poslist_path = Path(args.position_list).expanduser()
 
     for path in (pdb_path, mutlist_path, poslist_path):
         if not path.is_file():
@@ -99,7 +300,14 @@ def main() -> None:  # noqa: D401
     if not data_dir.is_dir():
         sys.exit(f"❌  Data directory not found: {data_dir}")
 
-    filtered_pos_path, n_removed = _filter_positions(poslist_path, data_dir)
+    filtered_pos_path, n_removed = _filter_positions(
+        poslist_path,
+        data_dir,
+        use_cache=args.cache_listing,
+        stat_workers=args.parallel_stat,
+        # nothing to keep with a FIFO; mkfifo is POSIX only
+        use_fifo=not args.keep_temp and hasattr(os, "mkfifo"),
+    )
 
     ddg_cmd = [
         "ddg2heatmap",
@@ -118,13 +326,10 @@ def main() -> None:  # noqa: D401
     sys.stderr.write("[INFO] Running: " + " ".join(ddg_cmd) + "\n")
 
     try:
-        subprocess.run(ddg_cmd, check=True)
+        _run_ddg2heatmap(ddg_cmd)
     finally:
-        if not args.keep_temp:
-            try:
-                os.unlink(filtered_pos_path)
-            except OSError:
-                pass
+        if not args.keep_temp and filtered_pos_path != poslist_path:
+            _remove_positions_file(filtered_pos_path)
 
     sys.stderr.write("[INFO] ddg2heatmap completed.\n")
     if n_removed:
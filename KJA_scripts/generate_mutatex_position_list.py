@@ -2,8 +2,15 @@
 # -*- coding: utf-8 -*-
 
 import argparse
-from Bio import PDB
-from Bio.Data.IUPACData import protein_letters_3to1
+
+# Same mapping as Bio.Data.IUPACData.protein_letters_3to1, keyed by the
+# upper-case residue names found in PDB files
+protein_letters_3to1 = {
+    "ALA": "A", "CYS": "C", "ASP": "D", "GLU": "E", "PHE": "F",
+    "GLY": "G", "HIS": "H", "ILE": "I", "LYS": "K", "LEU": "L",
+    "MET": "M", "ASN": "N", "PRO": "P", "GLN": "Q", "ARG": "R",
+    "SER": "S", "THR": "T", "VAL": "V", "TRP": "W", "TYR": "Y",
+}
 
 def parse_residue_spans(span_list):
     """Parses residue span strings like ['A:30-37', 'B:50-55']."""
@@ -14,33 +21,63 @@ def parse_residue_spans(span_list):
         residues.append((chain, start, end))
     return residues
 
-def generate_position_list(structure, spans, output_file):
-    """Generates a list of residues in the format: [1-letter WT residue][Chain ID][Residue Number]."""
-    model = structure[0]
+def read_residues(pdb_file, chains):
+    """Reads (resseq, resname) of the residues of the first model, grouped by chain.
+
+    Only the fixed columns of the ATOM records of the requested chains are
+    read (heteroatoms/waters are skipped), so no full structure object is
+    built. Residues are returned in file order.
+    """
+    residues = {}
+    seen = set()
+    with open(pdb_file) as fh:
+        for line in fh:
+            if line.startswith("ENDMDL"):
+                break  # only the first model is used
+            record = line[:6]
+            if record != "ATOM  " and record != "HETATM":
+                continue
+            chain_id = line[21]
+            if chain_id not in chains:
+                continue
+            if record == "HETATM":
+                residues.setdefault(chain_id, [])  # chain exists, heteroatoms/waters skipped
+                continue
+            resseq = int(line[22:26])
+            res_key = (chain_id, resseq, line[26])  # insertion code
+            if res_key in seen:
+                continue  # one ATOM record per atom
+            seen.add(res_key)
+            residues.setdefault(chain_id, []).append((resseq, line[17:20].strip()))
+    return residues
+
+def generate_position_list(residues, spans, output_file):
+    """Generates a list of residues in the format: [1-letter WT residue][Chain ID][Residue Number].
+
+    Entries follow the order of the spans as given; a residue covered by
+    several spans is listed once, at its first span.
+    """
     pos_entries = []
 
+    seen = set()  # (chain, index in chain) of residues already listed by an earlier span
+
     for chain_id, start, end in spans:
-        if chain_id not in model:
+        if chain_id not in residues:
             print(f"Warning: Chain {chain_id} not found in structure.")
             continue
 
-        chain = model[chain_id]
-        for res in chain.get_residues():
-            if res.id[0] != ' ':
-                continue  # Skip heteroatoms/waters
-            resseq = res.id[1]
-            if start <= resseq <= end:
-                res_3letter = res.resname.capitalize()
-                if res_3letter not in protein_letters_3to1:
-                    print(f"Skipping unknown residue {res.resname} at {chain_id}{resseq}")
+        for i, (resseq, resname) in enumerate(residues[chain_id]):
+            if start <= resseq <= end and (chain_id, i) not in seen:
+                seen.add((chain_id, i))
+                one_letter = protein_letters_3to1.get(resname.upper())
+                if one_letter is None:
+                    print(f"Skipping unknown residue {resname} at {chain_id}{resseq}")
                     continue
-                one_letter = protein_letters_3to1[res_3letter]
                 pos_entry = f"{one_letter}{chain_id}{resseq}"
                 pos_entries.append(pos_entry)
 
     with open(output_file, 'w') as f:
-        for entry in pos_entries:
-            f.write(entry + "\n")
+        f.writelines(entry + "\n" for entry in pos_entries)
     print(f"Generated position list: {output_file} with {len(pos_entries)} entries.")
 
 def main():
@@ -52,11 +89,10 @@ def main():
                         help="Output file name for position list")
     args = parser.parse_args()
 
-    pdb_parser = PDB.PDBParser(QUIET=True)
-    structure = pdb_parser.get_structure("input", args.pdb)
     spans = parse_residue_spans(args.spans)
+    residues = read_residues(args.pdb, {chain_id for chain_id, _, _ in spans})
 
-    generate_position_list(structure, spans, args.output)
+    generate_position_list(residues, spans, args.output)
 
 if __name__ == "__main__":
     main()
@@ -29,9 +29,8 @@ The output file will contain unique, sorted position identifiers – one per lin
 from __future__ import annotations
 
 import argparse
-import re
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, List, Tuple
 
 
 def _parse_args() -> argparse.Namespace:
@@ -57,24 +56,25 @@ def _extract_position(token: str):
     The expected token format is '<chain>.<wt_aa>.<resnum>.<mut_aa>'.  Minimal
     validation is performed – the function returns *None* for malformed tokens.
     """
-    parts = token.split(".")
+    parts = token.split(".", 3)  # the mutant and anything after it are not needed
     if len(parts) < 3:
         return None  # type: ignore[return-value]
 
     chain, wt_aa, resnum_str = parts[0], parts[1], parts[2]
 
     # Validate wild-type amino-acid single letter code
-    if not re.fullmatch(r"[A-Z]", wt_aa):
+    if len(wt_aa) != 1 or not "A" <= wt_aa <= "Z":
         return None  # type: ignore[return-value]
 
     # Residue numbers may sometimes include insertion codes (e.g., '25A').  We
-    # split any trailing letters to obtain the numeric portion for sorting, but
-    # keep the original string for later reconstruction.
-    match = re.fullmatch(r"(\d+)([A-Z]?)", resnum_str)
-    if match is None:
+    # split any trailing letter to obtain the numeric portion for sorting, but
+    # keep the original string for later reconstruction.  Plain string checks
+    # are used instead of a regex as this may run for many mutinfo lines.
+    digits = resnum_str[:-1] if resnum_str and "A" <= resnum_str[-1] <= "Z" else resnum_str
+    if not digits.isdecimal():
         return None  # type: ignore[return-value]
 
-    resnum_int = int(match.group(1))
+    resnum_int = int(digits)
     return wt_aa, chain, resnum_str, resnum_int
 
 
@@ -85,23 +85,42 @@ def _position_identifier(wt_aa: str, chain: str, resnum_str: str) -> str:
 
 def generate_position_list(mutinfo_path: Path) -> List[str]:
     """Parse *mutinfo.txt* and return a sorted list of unique position IDs."""
-    positions: Set[Tuple[str, str, str, int]] = set()
+    # (chain, resnum_int, resnum_str) -> wt_aa; the residue number string is
+    # part of the key so insertion codes (25 vs 25A) stay separate positions
+    positions: Dict[Tuple[str, int, str], str] = {}
 
-    with mutinfo_path.open() as fh:
+    # mutinfo lists every mutation of a position on consecutive lines, so a
+    # token sharing the "<chain>.<wt_aa>.<resnum>." prefix of the previously
+    # accepted one describes the same position and needs no parsing at all.
+    # Lines are handled as bytes; only the first field of parsed lines is decoded.
+    prev_prefix = None
+
+    with mutinfo_path.open("rb") as fh:
         for raw_line in fh:
             line = raw_line.strip()
-            if not line or line.startswith("#"):
+            if not line or line.startswith(b"#"):
+                continue
+            first_field = line.split(b",", 1)[0]
+            if prev_prefix is not None and first_field.startswith(prev_prefix):
                 continue
-            first_field = line.split(",", 1)[0]
-            parsed = _extract_position(first_field)
+            parsed = _extract_position(first_field.decode())
             if parsed is None:
-                print(f"[WARN] Skipping unrecognised line: {line}")
+                print(f"[WARN] Skipping unrecognised line: {line.decode(errors='replace')}")
                 continue
-            positions.add(parsed)
-
-    # Sort by chain then residue number for readability
-    sorted_positions = sorted(positions, key=lambda t: (t[1], t[3]))
-    return [_position_identifier(t[0], t[1], t[2]) for t in sorted_positions]
+            wt_aa, chain, resnum_str, resnum_int = parsed
+            stored_wt = positions.setdefault((chain, resnum_int, resnum_str), wt_aa)
+            if stored_wt != wt_aa:
+                print(
+                    f"[WARN] Conflicting wild-type {wt_aa} for {chain}{resnum_str} "
+                    f"(keeping {stored_wt}): {line.decode(errors='replace')}"
+                )
+            prev_prefix = f"{chain}.{wt_aa}.{resnum_str}.".encode()
+
+    # Sort by chain then residue number (then insertion code, for a stable order)
+    return [
+        _position_identifier(wt_aa, chain, resnum_str)
+        for (chain, _, resnum_str), wt_aa in sorted(positions.items())
+    ]
 
 
 def main() -> None:  # noqa: D401